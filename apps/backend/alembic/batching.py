@@ -0,0 +1,81 @@
+"""Helpers for batched data backfills in Alembic migrations."""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def batch_update(conn: Connection, sql: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Run a self-limiting UPDATE/DELETE until a batch touches fewer than batch_size rows.
+
+    The statement must cap itself with the ``:batch_size`` bind parameter and
+    only match rows that still need work, so every pass makes progress:
+
+        UPDATE users SET tier = 'free'
+        WHERE id IN (SELECT id FROM users WHERE tier IS NULL LIMIT :batch_size)
+
+    Call it inside ``op.get_context().autocommit_block()`` so every batch
+    commits on its own and locks are held only for one batch at a time.
+    It reads row counts back, so it cannot run in offline (``--sql``) mode;
+    guard it with ``context.is_offline_mode()`` and emit a plain statement there.
+
+    Args:
+        conn: Migration connection (``op.get_bind()``)
+        sql: Bounded statement using ``:batch_size``
+        batch_size: Rows per batch
+
+    Returns:
+        Total number of rows affected
+    """
+    total = 0
+    while True:
+        affected = conn.execute(text(sql), {"batch_size": batch_size}).rowcount
+        total += affected
+        if affected < batch_size:
+            return total
+
+
+def batch_update_by_row_number(
+    conn: Connection, source_sql: str, sql: str, batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """
+    Run an UPDATE over consecutive row_number ranges of a precomputed id list.
+
+    ``source_sql`` selects an ``id`` column for every row to process (joins are
+    fine). The ids are numbered once into the ``_batch_ids`` temp table, so each
+    batch is an index range seek rather than an OFFSET scan that re-reads all
+    earlier rows. ``sql`` restricts itself to one range:
+
+        UPDATE projects SET ... FROM _batch_ids
+        WHERE projects.id = _batch_ids.id AND _batch_ids.rn BETWEEN :lo AND :hi
+
+    Like batch_update, call it inside ``op.get_context().autocommit_block()``
+    and only in online mode.
+
+    Args:
+        conn: Migration connection (``op.get_bind()``)
+        source_sql: Query selecting the ids to process
+        sql: Statement bounded by ``:lo``/``:hi`` on ``_batch_ids.rn``
+        batch_size: Rows per batch
+
+    Returns:
+        Total number of rows affected
+    """
+    conn.execute(
+        text(
+            "CREATE TEMP TABLE _batch_ids AS "
+            f"SELECT id, row_number() OVER (ORDER BY id) AS rn FROM ({source_sql}) AS source"
+        )
+    )
+    try:
+        conn.execute(text("CREATE INDEX ON _batch_ids (rn)"))
+        count = conn.execute(text("SELECT count(*) FROM _batch_ids")).scalar_one()
+
+        total = 0
+        for lo in range(1, count + 1, batch_size):
+            total += conn.execute(text(sql), {"lo": lo, "hi": lo + batch_size - 1}).rowcount
+        return total
+    finally:
+        conn.execute(text("DROP TABLE IF EXISTS _batch_ids"))
@@ -0,0 +1,45 @@
+"""Add reset_token_hash to users
+
+Revision ID: 16d14e79af0f
+Revises: 26f73f8e9e35
+Create Date: 2026-10-14 11:04:52.913377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "16d14e79af0f"
+down_revision: Union[str, Sequence[str], None] = "26f73f8e9e35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("reset_token_hash", sa.String(length=64), nullable=True))
+
+    # Keep outstanding reset tokens usable after the deploy
+    op.execute(
+        "UPDATE users SET reset_token_hash = encode(sha256(convert_to(reset_token, 'UTF8')), 'hex') "
+        "WHERE reset_token IS NOT NULL"
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_reset_token_hash",
+            "users",
+            ["reset_token_hash"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_reset_token_hash", table_name="users")
+    op.drop_column("users", "reset_token_hash")
@@ -0,0 +1,40 @@
+"""Add GIN index on users.settings
+
+Revision ID: 2071c38907f0
+Revises: 16d14e79af0f
+Create Date: 2026-10-14 15:12:37.402518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2071c38907f0"
+down_revision: Union[str, Sequence[str], None] = "16d14e79af0f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # jsonb_path_ops GIN is smaller than the default jsonb_ops and serves `settings @> ...` lookups.
+        # IF NOT EXISTS: databases built from an earlier draft of 3c45e79180a3 already have it
+        op.create_index(
+            "ix_users_settings_gin",
+            "users",
+            ["settings"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"settings": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_users_settings_gin", table_name="users", postgresql_concurrently=True, if_exists=True)
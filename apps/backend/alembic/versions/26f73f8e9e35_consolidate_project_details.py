@@ -0,0 +1,97 @@
+"""Consolidate project arrays into details JSONB
+
+Revision ID: 26f73f8e9e35
+Revises: c835a82da87a
+Create Date: 2026-10-14 10:12:31.482107
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from batching import batch_update_by_row_number
+
+# revision identifiers, used by Alembic.
+revision: str = '26f73f8e9e35'
+down_revision: Union[str, Sequence[str], None] = 'c835a82da87a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARRAY_COLUMNS = ('technologies', 'achievements', 'challenges')
+
+DETAILS_FROM_ARRAYS = """
+    jsonb_build_object(
+        'technologies', to_jsonb(projects.technologies),
+        'achievements', to_jsonb(projects.achievements),
+        'challenges', to_jsonb(projects.challenges)
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'projects',
+        sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'"), nullable=False),
+    )
+
+    # Move the three parallel arrays into one document: {"technologies": [...], "achievements": [...], ...}
+    if context.is_offline_mode():
+        # Generated SQL cannot read row counts back to drive batches; emit one UPDATE
+        op.execute(f"UPDATE projects SET details = {DETAILS_FROM_ARRAYS}")
+    else:
+        with op.get_context().autocommit_block():
+            batch_update_by_row_number(
+                op.get_bind(),
+                "SELECT id FROM projects",
+                f"""
+                UPDATE projects
+                SET details = {DETAILS_FROM_ARRAYS}
+                FROM _batch_ids
+                WHERE projects.id = _batch_ids.id AND _batch_ids.rn BETWEEN :lo AND :hi
+                """,
+            )
+
+    for column in ARRAY_COLUMNS:
+        op.drop_column('projects', column)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # jsonb_path_ops serves `details @> '{"technologies": ["Python"]}'` across all three keys
+        op.create_index(
+            'ix_projects_details_gin',
+            'projects',
+            ['details'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'details': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_details_gin', table_name='projects')
+
+    for column in ARRAY_COLUMNS:
+        op.add_column(
+            'projects',
+            sa.Column(column, postgresql.ARRAY(sa.String()), server_default=sa.text("'{}'"), nullable=False),
+        )
+
+    op.execute(
+        """
+        UPDATE projects
+        SET technologies = ARRAY(SELECT jsonb_array_elements_text(COALESCE(details->'technologies', '[]'))),
+            achievements = ARRAY(SELECT jsonb_array_elements_text(COALESCE(details->'achievements', '[]'))),
+            challenges = ARRAY(SELECT jsonb_array_elements_text(COALESCE(details->'challenges', '[]')))
+        """
+    )
+
+    for column in ARRAY_COLUMNS:
+        op.alter_column('projects', column, server_default=None)
+
+    op.drop_column('projects', 'details')
@@ -35,7 +35,17 @@ def upgrade() -> None:
         sa.Column("settings", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'{}'")),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # No IF NOT EXISTS: a failed concurrent build leaves an INVALID index behind that
+        # still enforces uniqueness, and IF NOT EXISTS would keep it on retry. Drop it first.
+        op.create_index(
+            "ix_users_email",
+            "users",
+            ["email"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
     op.create_index("ix_users_is_active", "users", ["is_active"], unique=False)
 
 
@@ -0,0 +1,50 @@
+"""Replace the is_active index with a partial index on active users
+
+Revision ID: 826e59bdb6f6
+Revises: 2071c38907f0
+Create Date: 2026-10-14 15:26:08.118094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "826e59bdb6f6"
+down_revision: Union[str, Sequence[str], None] = "2071c38907f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    # IF [NOT] EXISTS: databases built from an earlier draft of 3c45e79180a3 already have
+    # ix_users_active and no ix_users_is_active
+    with op.get_context().autocommit_block():
+        # Partial index: queries only ever filter on active users, inactive rows stay out of the tree
+        op.create_index(
+            "ix_users_active",
+            "users",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_users_is_active", table_name="users", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_is_active",
+            "users",
+            ["is_active"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_users_active", table_name="users", postgresql_concurrently=True, if_exists=True)
@@ -7,5 +7,6 @@ from app.api.v1 import auth
 # Create main API v1 router
 api_router = APIRouter(prefix="/api/v1")
 
-# Include authentication router
-api_router.include_router(auth.router, tags=["authentication"])
+# Include domain routers, each mounted under its own prefix.
+# Keep the highest-traffic routers first: routes are matched in inclusion order.
+api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
@@ -2,15 +2,12 @@
 
 import logging
 
-from authlib.integrations.starlette_client import OAuthError  # type: ignore[import-untyped]
 from fastapi import APIRouter, Request, status
-from fastapi_core import token_blacklist
 
 from app.settings import settings
 from app.decorators import rate_limit, recaptcha_protected
 from app.dependencies import BearerCredentials, CurrentActiveUser, DBSession
 from app.exceptions import InvalidCredentialsError
-from app.oauth import oauth
 from app.schemas.auth import (
     LoginResponse,
     MessageResponse,
@@ -25,7 +22,7 @@ from app.schemas.auth import (
 )
 from app.services.auth_service import AuthService
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
@@ -123,10 +120,11 @@ async def forgot_password(request: Request, forgot_request: ForgotPasswordReques
         # TODO: Send email with reset link
         # await send_password_reset_email(forgot_request.email, token)
 
-        # For development only - log the reset link
-        if settings.app.environment == "development":
-            reset_link = f"{settings.frontend_url}/reset-password/{token}"
-            logger.info(f"Password reset link for {forgot_request.email}: {reset_link}")
+        # For development only - log the reset link (formatted only if INFO is enabled)
+        if settings.app.environment == "development" and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Password reset link for %s: %s/reset-password/%s", forgot_request.email, settings.frontend_url, token
+            )
 
     # Always return success message for security (don't reveal if email exists)
     return MessageResponse(message="If the email exists, a password reset link has been sent")
@@ -191,6 +189,9 @@ async def google_login(request: Request):
     Redirects the user to Google's OAuth consent screen.
     After authentication, Google will redirect back to the callback endpoint.
     """
+    # Imported lazily so authlib is only loaded once the OAuth flow is actually used
+    from app.oauth import oauth
+
     # Build redirect URI dynamically from request
     redirect_uri = str(request.url_for("google_callback"))
     return await oauth.google.authorize_redirect(request, redirect_uri)
@@ -207,6 +208,10 @@ async def google_callback(request: Request, db: DBSession) -> LoginResponse:
 
     If the user doesn't exist, a new account is created automatically.
     """
+    from authlib.integrations.starlette_client import OAuthError  # type: ignore[import-untyped]
+
+    from app.oauth import oauth
+
     try:
         # Exchange authorization code for access token
         token = await oauth.google.authorize_access_token(request)
@@ -0,0 +1,72 @@
+"""In-process caches for hot authentication lookups."""
+
+import hashlib
+import time
+from datetime import datetime
+from typing import Any, Dict, NamedTuple
+
+from cachetools import TLRUCache, TTLCache
+from fastapi_core import verify_token
+
+from app.settings import settings
+
+# Upper bound for how long a verified token payload is reused without re-checking
+# the signature and the blacklist. Tokens revoked by another worker stay usable on
+# this one for at most this long.
+TOKEN_CACHE_TTL = 60
+
+
+class CachedUser(NamedTuple):
+    """Immutable snapshot of the user columns read downstream of authentication."""
+
+    id: str
+    email: str
+    name: str
+    is_active: bool
+    tier: str
+    created_at: datetime
+
+
+# Authenticated users keyed by ULID. Entries are plain snapshots rather than ORM
+# instances, so no session's state is ever shared between requests; get_current_user
+# builds a fresh User from them for each request session.
+user_cache: TTLCache[str, CachedUser] = TTLCache(maxsize=10_000, ttl=30)
+
+
+def _token_ttu(_key: bytes, payload: Dict[str, Any], now: float) -> float:
+    """Expire a cached payload after TOKEN_CACHE_TTL or at the token's own exp, whichever is sooner."""
+    return now + min(TOKEN_CACHE_TTL, payload.get("exp", 0) - time.time())
+
+
+# Verified token payloads keyed by a digest of the raw token
+token_cache: TLRUCache[bytes, Dict[str, Any]] = TLRUCache(maxsize=50_000, ttu=_token_ttu)
+
+
+def _token_key(token: str) -> bytes:
+    """Hash a raw token into a compact cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def verify_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT, reusing the payload of a recent successful verification.
+
+    On a cache hit both the signature check and the blacklist lookup are
+    skipped; otherwise this delegates to fastapi-core's verify_token.
+    """
+    key = _token_key(token)
+    payload = token_cache.get(key)
+    if payload is None:
+        payload = verify_token(token, settings)
+        token_cache[key] = payload
+    return payload
+
+
+def invalidate_token(token: str) -> None:
+    """Drop a cached token payload, e.g. after the token is blacklisted."""
+    token_cache.pop(_token_key(token), None)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a cached user so the next request reloads it from the database."""
+    user_cache.pop(user_id, None)
@@ -1,52 +1,160 @@
 """Database connection and session management."""
 
-from typing import Generator
+import logging
+from typing import Any, AsyncGenerator, Dict, Mapping, Sequence
 
-from sqlalchemy import create_engine
+from sqlalchemy import Table, insert, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 
 from app.settings import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.database.url,
+logger = logging.getLogger(__name__)
+
+
+# Async drivers used by the application for each supported backend
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def _async_database_url(url: str) -> URL:
+    """
+    Rewrite a database URL to use the backend's async driver.
+
+    DATABASE_URL stays a plain ``postgresql://`` (or ``sqlite://``) URL so
+    Alembic can keep using the sync drivers for migrations.
+    """
+    parsed = make_url(url)
+    drivername = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if drivername is not None:
+        parsed = parsed.set(drivername=drivername)
+    return parsed
+
+
+def _pool_options(url: URL) -> Dict[str, Any]:
+    """Build connection pool arguments for the engine from settings."""
+    if url.get_backend_name() != "postgresql":
+        # Pool tuning and connect_args below are asyncpg-specific; e.g. local SQLite keeps the defaults
+        return {}
+
+    if settings.database_use_pgbouncer:
+        # PgBouncer already pools server connections; pooling here as well would pin them.
+        # Transaction mode also cannot keep asyncpg's prepared statements across transactions.
+        return {"poolclass": NullPool, "connect_args": {"statement_cache_size": 0}}
+
+    return {
+        "pool_size": settings.database_pool_size,  # Number of connections to keep open
+        "max_overflow": settings.database_max_overflow,  # Max connections beyond pool_size
+        "pool_recycle": settings.database_pool_recycle,  # Replace connections before idle proxies drop them
+        "pool_use_lifo": True,  # Reuse the most recent connection so idle ones can time out
+        "connect_args": {"server_settings": {"statement_timeout": str(settings.database_statement_timeout_ms)}},
+    }
+
+
+# Create SQLAlchemy async engine
+_database_url = _async_database_url(settings.database.url)
+engine = create_async_engine(
+    _database_url,
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Number of connections to keep open
-    max_overflow=20,  # Max number of connections to create beyond pool_size
+    insertmanyvalues_page_size=1000,  # Rows per batched INSERT ... VALUES statement
+    **_pool_options(_database_url),
 )
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
 
-    Yields a SQLAlchemy session and ensures it's closed after use.
+    Yields an async SQLAlchemy session and ensures it's closed after use.
     Use this as a FastAPI dependency in endpoints.
 
     Example:
         @router.get("/users")
-        def get_users(db: Session = Depends(get_db)):
-            return db.query(User).all()
+        async def get_users(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(User))
+            return result.scalars().all()
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """
     Initialize database tables.
 
     This creates all tables defined in SQLAlchemy models.
     In production, use Alembic migrations instead.
+
+    Each table (with its indexes) is created in its own transaction, in
+    dependency order, so a failure leaves the earlier tables committed and
+    a rerun picks up where it stopped.
+    """
+    for table in Base.metadata.sorted_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[table])
+        logger.info("Initialized table %s", table.name)
+
+
+async def bulk_insert(db: AsyncSession, table: Table, rows: Sequence[Mapping[str, Any]]) -> None:
+    """
+    Insert many rows into a table in as few round-trips as possible.
+
+    Rows are sent as one executemany INSERT. Values go through the column
+    types and Python-side column defaults apply, whatever the batch size.
+    For very large PostgreSQL loads where that matters less, see copy_rows.
+
+    Args:
+        db: Database session whose connection runs the insert
+        table: Target table (e.g. ``User.__table__``)
+        rows: Row mappings keyed by column name
     """
-    Base.metadata.create_all(bind=engine)
+    if not rows:
+        return
+
+    await db.execute(insert(table), list(rows))
+
+
+async def copy_rows(db: AsyncSession, table: Table, rows: Sequence[Mapping[str, Any]]) -> None:
+    """
+    Stream rows into a PostgreSQL table with the COPY protocol through asyncpg.
+
+    Faster than bulk_insert for large batches, but COPY bypasses SQLAlchemy:
+    no column defaults are applied (such as ULID primary keys, ``tier`` or
+    ``is_active``) and values are not run through the column types, so they
+    must already be in asyncpg's form, e.g. JSON/JSONB values as JSON text
+    rather than dicts. Every row has to carry the same complete set of keys.
+
+    The copy runs inside the session's transaction: it is committed or
+    rolled back together with the rest of the session's work.
+
+    Args:
+        db: Database session whose connection runs the copy
+        table: Target table (e.g. ``User.__table__``)
+        rows: Row mappings keyed by column name
+    """
+    if not rows:
+        return
+
+    columns = list(rows[0].keys())
+    connection = await db.connection()
+    # SQLAlchemy's asyncpg adapter only opens its transaction when a statement runs
+    # through it; a COPY issued first on the raw connection would autocommit on its own
+    await connection.execute(text("SELECT 1"))
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("COPY requires an open asyncpg connection")
+
+    await driver_connection.copy_records_to_table(
+        table.name,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+        schema_name=table.schema,
+    )
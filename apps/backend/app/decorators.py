@@ -1,5 +1,6 @@
 """Custom decorators for authentication, rate limiting, and validation."""
 
+from functools import lru_cache
 from typing import Callable
 
 from fastapi_core.middleware.rate_limit import limiter
@@ -8,6 +9,12 @@ from fastapi_core import recaptcha_protected as core_recaptcha_protected
 from app.settings import settings
 
 
+@lru_cache(maxsize=1)
+def _limiter():
+    """Return the Limiter shared by every rate-limited endpoint."""
+    return limiter(settings)
+
+
 def rate_limit(limit: str):
     """
     Decorator for rate limiting.
@@ -28,7 +35,7 @@ def rate_limit(limit: str):
 
     def decorator(func: Callable) -> Callable:
         # Apply limiter.limit directly - it will handle the request parameter
-        return limiter(settings).limit(limit)(func)
+        return _limiter().limit(limit)(func)
 
     return decorator
 
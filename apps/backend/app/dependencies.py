@@ -1,24 +1,67 @@
 """FastAPI dependencies for authentication and authorization."""
 
+import re
 from typing import Annotated, Optional
 
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
-from fastapi_core import verify_token
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.cache import CachedUser, user_cache, verify_token_cached
 from app.database import get_db
 from app.exceptions import InvalidTokenError, UserNotFoundError, InactiveUserError
-from app.models.user import User
-from app.settings import settings
+from app.models.user import User, is_valid_user_id
 
 # Security scheme for Bearer token
 security = HTTPBearer()
 
+# Structural shape of a compact JWS: three base64url segments of sane length
+_JWT_SHAPE_RE = re.compile(r"[A-Za-z0-9_-]{16,4096}\.[A-Za-z0-9_-]{16,4096}\.[A-Za-z0-9_-]{16,4096}")
+
+
+def _fast_jwt_shape_ok(token: str) -> bool:
+    """Cheaply reject values that cannot be a JWT before any signature verification."""
+    return _JWT_SHAPE_RE.fullmatch(token) is not None
+
+
+async def _load_current_user(user_id: str, db: AsyncSession) -> Optional[CachedUser]:
+    """
+    Select only the columns read downstream of authentication.
+
+    hashed_password, reset_token and the settings JSONB blob are left out.
+    The select is built per call, so the mappers are not configured at import.
+    """
+    row = (
+        await db.execute(
+            select(User.id, User.email, User.name, User.is_active, User.tier, User.created_at).where(
+                User.id == user_id
+            )
+        )
+    ).first()
+    return CachedUser._make(row) if row is not None else None
+
+
+def _attach_user(cached_user: CachedUser, db: AsyncSession) -> User:
+    """
+    Build a persistent User in the request session from a column snapshot.
+
+    The instance is new for every request, so changes made to it never leak
+    into other sessions. Columns outside the snapshot stay unloaded and must
+    not be read from it: an AsyncSession cannot lazy load, so the access raises
+    MissingGreenlet. Load them explicitly, e.g. ``await db.refresh(user,
+    ["settings"])``, or query them separately.
+    """
+    user = User(**cached_user._asdict())
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from JWT token.
@@ -42,27 +85,34 @@ async def get_current_user(
     if credentials.scheme.lower() != "bearer":
         raise InvalidTokenError("Invalid authentication scheme")
 
-    # Verify token (checks blacklist and JWT validity)
-    payload = verify_token(credentials.credentials, settings)
+    # Reject garbage Bearer values without paying for HMAC verification or a blacklist lookup
+    if not _fast_jwt_shape_ok(credentials.credentials):
+        raise InvalidTokenError()
+
+    # Verify token (checks blacklist and JWT validity, cached for repeat presentations)
+    payload = verify_token_cached(credentials.credentials)
 
     # Get user ID from token (ULID as string)
     user_id: Optional[str] = payload.get("sub")
     if not user_id:
         raise InvalidTokenError("Invalid token payload")
 
-    # Basic validation that it looks like a ULID (26 characters, alphanumeric)
-    if not isinstance(user_id, str) or len(user_id) != 26:
+    # Validate ULID format before it reaches the cache or the database
+    if not is_valid_user_id(user_id):
         raise InvalidTokenError("Invalid user ID format in token")
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise UserNotFoundError()
+    # Get user columns from the short-lived cache, falling back to a primary key lookup
+    cached_user = user_cache.get(user_id)
+    if cached_user is None:
+        cached_user = await _load_current_user(user_id, db)
+        if cached_user is None:
+            raise UserNotFoundError()
+        user_cache[user_id] = cached_user
 
-    if not user.is_active:
+    if not cached_user.is_active:
         raise InactiveUserError()
 
-    return user
+    return _attach_user(cached_user, db)
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -95,7 +145,7 @@ CurrentActiveUser = Annotated[User, Depends(get_current_active_user)]
 BearerCredentials = Annotated[HTTPAuthorizationCredentials, Depends(security)]
 """Type alias for HTTP Bearer token credentials."""
 
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncSession, Depends(get_db)]
 """Type alias for database session dependency."""
 
 
@@ -134,6 +184,6 @@ class Dependencies:
         return Depends(security)
 
     @staticmethod
-    def db_session() -> Session:
+    def db_session() -> AsyncSession:
         """Get database session."""
         return Depends(get_db)
@@ -1,32 +1,53 @@
 """User model for authentication and profile management."""
 
+import re
 import secrets
-from datetime import datetime
-from typing import Any, Dict, TYPE_CHECKING
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, DateTime, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from ulid import ULID
-from fastapi_core import verify_password, get_password_hash
+from fastapi_core import verify_token
 
 from app.database import Base
+from app.security import check_password, hash_password, hash_reset_token
+from app.settings import settings as app_settings
 
 if TYPE_CHECKING:
     pass
 
+# Canonical ULID string as generated for User.id: 26 Crockford base32 characters,
+# the first at most 7 because a ULID is 128 bits
+_ULID_RE = re.compile(r"[0-7][0-9A-HJKMNP-TV-Z]{25}")
+
+
+def is_valid_user_id(value: object) -> bool:
+    """Check that a value is a canonical ULID string, e.g. a token's sub claim."""
+    return isinstance(value, str) and _ULID_RE.fullmatch(value) is not None
+
 
 class User(Base):
     """User model with authentication and profile fields."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_active", "id", postgresql_where=text("is_active")),
+        Index(
+            "ix_users_settings_gin",
+            "settings",
+            postgresql_using="gin",
+            postgresql_ops={"settings": "jsonb_path_ops"},
+        ),
+    )
 
     # Primary fields
     id = Column(String(26), primary_key=True, default=lambda: str(ULID()))
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -34,6 +55,7 @@ class User(Base):
 
     # Password reset fields
     reset_token = Column(Text, nullable=True)
+    reset_token_hash = Column(String(64), nullable=True, index=True)  # SHA-256 hex digest for lookup
     reset_token_expiry = Column(DateTime(timezone=True), nullable=True)
 
     # Business model: SaasMultirepo tiers
@@ -47,20 +69,23 @@ class User(Base):
 
     def verify_password(self, password: str) -> bool:
         """Verify password against stored hash."""
-        return verify_password(password, str(self.hashed_password))
+        is_valid, _ = check_password(password, str(self.hashed_password))
+        return is_valid
 
     def set_password(self, password: str) -> None:
         """Set new password hash."""
-        self.hashed_password = get_password_hash(password)  # type: ignore[assignment]
+        self.hashed_password = hash_password(password)  # type: ignore[assignment]
 
     def set_reset_token(self, token: str, expiry: datetime) -> None:
         """Set password reset token and expiry."""
         self.reset_token = token  # type: ignore[assignment]
+        self.reset_token_hash = hash_reset_token(token)  # type: ignore[assignment]
         self.reset_token_expiry = expiry  # type: ignore[assignment]
 
     def clear_reset_token(self) -> None:
         """Clear password reset token."""
         self.reset_token = None  # type: ignore[assignment]
+        self.reset_token_hash = None  # type: ignore[assignment]
         self.reset_token_expiry = None  # type: ignore[assignment]
 
     def is_reset_token_valid(self, token: str) -> bool:
@@ -68,9 +93,17 @@ class User(Base):
         if not self.reset_token:
             return False
 
+        expiry = self.reset_token_expiry
+        if expiry is not None:
+            # SQLite returns naive datetimes; stored values are always UTC
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)
+            if expiry < datetime.now(timezone.utc):
+                return False
+
         try:
             # Verify JWT token
-            payload = verify_token(token)
+            payload = verify_token(token, app_settings)
 
             # Check token type
             if payload.get("type") != "password_reset":
@@ -88,22 +121,6 @@ class User(Base):
         except Exception:
             return False
 
-    def to_dict(self) -> Dict[str, Any]:
-        """
-        Convert to camelCase dict for API responses.
-
-        Returns a sanitized dictionary suitable for public API responses.
-        Excludes sensitive fields like hashed_password and reset tokens.
-        """
-        return {
-            "id": self.id,
-            "email": self.email,
-            "name": self.name,
-            "isActive": self.is_active,
-            "createdAt": self.created_at,
-            "tier": self.tier,
-        }
-
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"<User(id={self.id}, email={self.email}, tier={self.tier})>"
@@ -1,15 +1,93 @@
 """Authentication schemas for request/response validation."""
 
 import re
+import string
 from datetime import datetime
+from typing import Annotated, Any
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import AfterValidator, BaseModel, BeforeValidator, EmailStr, Field
+from pydantic_core import PydanticCustomError
+
+# All four character classes in one pattern, so valid passwords cost a single regex call
+_STRONG_PASSWORD_RE = re.compile(r'(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*(),.?":{}|<>])', re.DOTALL)
+
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+
+# RFC 5321 limit for a forward path; EmailStr itself only rejects inputs over 2048 chars
+_MAX_EMAIL_LENGTH = 254
+
+
+def _invalid_email(reason: str) -> PydanticCustomError:
+    """Build the same error EmailStr raises for an invalid address."""
+    return PydanticCustomError("value_error", "value is not a valid email address: {reason}", {"reason": reason})
+
+
+def _prefilter_email(v: Any) -> Any:
+    """
+    Reject oversized and malformed addresses before EmailStr validates them.
+
+    These checks bound the cost of the email-validator regexes on
+    adversarial input; anything that passes is validated and normalized by
+    EmailStr as usual. Non-string input is left for EmailStr to reject.
+    """
+    if not isinstance(v, str):
+        return v
+    if len(v) > _MAX_EMAIL_LENGTH:
+        raise _invalid_email(f"Length must not exceed {_MAX_EMAIL_LENGTH} characters")
+    if v.count("@") != 1:
+        raise _invalid_email("An email address must have exactly one @-sign.")
+    if v[0] == "<" or not v[0].isprintable():
+        raise _invalid_email("An email address cannot start with this character.")
+    return v
+
+
+EmailAddress = Annotated[EmailStr, BeforeValidator(_prefilter_email)]
+
+
+def _check_password(v: str) -> str:
+    """
+    Validate password meets strength requirements.
+
+    Valid passwords are accepted by one combined pattern. Only when it fails
+    are the characters classified to report which requirement is missing.
+    """
+    if _STRONG_PASSWORD_RE.match(v):
+        return v
+
+    has_upper = has_lower = has_digit = False
+    for ch in v:
+        if ch in _UPPERCASE:
+            has_upper = True
+        elif ch in _LOWERCASE:
+            has_lower = True
+        elif ch.isdecimal():
+            has_digit = True
+
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not has_digit:
+        raise ValueError("Password must contain at least one digit")
+    raise ValueError('Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)')
+
+
+StrongPassword = Annotated[
+    str,
+    Field(
+        min_length=8,
+        max_length=100,
+        description="Password must contain uppercase, lowercase, digit, and special character",
+    ),
+    AfterValidator(_check_password),
+]
 
 
 class UserLogin(BaseModel):
     """User login request schema with camelCase."""
 
-    email: EmailStr
+    email: EmailAddress
     password: str = Field(..., min_length=8, max_length=100)
     recaptchaToken: str | None = Field(default=None, description="reCAPTCHA token")
 
@@ -17,30 +95,11 @@ class UserLogin(BaseModel):
 class UserRegister(BaseModel):
     """User registration request schema with camelCase."""
 
-    email: EmailStr
-    password: str = Field(
-        ...,
-        min_length=8,
-        max_length=100,
-        description="Password must contain uppercase, lowercase, digit, and special character",
-    )
+    email: EmailAddress
+    password: StrongPassword
     name: str = Field(..., min_length=1, max_length=100)
     recaptchaToken: str | None = Field(default=None, description="reCAPTCHA token")
 
-    @field_validator("password")
-    @classmethod
-    def validate_password_strength(cls, v: str) -> str:
-        """Validate password meets strength requirements."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)')
-        return v
-
 
 class TokenResponse(BaseModel):
     """Token response schema with camelCase."""
@@ -61,10 +120,10 @@ class UserResponse(BaseModel):
     """User response schema with camelCase."""
 
     id: str  # ULID as string
-    email: EmailStr
+    email: EmailAddress
     name: str
-    isActive: bool = Field(alias="is_active")
-    createdAt: datetime = Field(alias="created_at")
+    isActive: bool = Field(validation_alias="is_active")
+    createdAt: datetime = Field(validation_alias="created_at")
     tier: str = "free"
 
     model_config = {"from_attributes": True, "populate_by_name": True}
@@ -89,7 +148,7 @@ class MessageResponse(BaseModel):
 class ForgotPasswordRequest(BaseModel):
     """Forgot password request schema."""
 
-    email: EmailStr
+    email: EmailAddress
     recaptchaToken: str | None = Field(default=None, description="reCAPTCHA token")
 
 
@@ -97,49 +156,11 @@ class ResetPasswordRequest(BaseModel):
     """Reset password request schema."""
 
     token: str = Field(..., min_length=1)
-    newPassword: str = Field(
-        ...,
-        min_length=8,
-        max_length=100,
-        description="Password must contain uppercase, lowercase, digit, and special character",
-    )
-
-    @field_validator("newPassword")
-    @classmethod
-    def validate_password_strength(cls, v: str) -> str:
-        """Validate password meets strength requirements."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)')
-        return v
+    newPassword: StrongPassword
 
 
 class ChangePasswordRequest(BaseModel):
     """Change password request schema for authenticated users."""
 
     currentPassword: str = Field(..., min_length=1, max_length=100)
-    newPassword: str = Field(
-        ...,
-        min_length=8,
-        max_length=100,
-        description="Password must contain uppercase, lowercase, digit, and special character",
-    )
-
-    @field_validator("newPassword")
-    @classmethod
-    def validate_password_strength(cls, v: str) -> str:
-        """Validate password meets strength requirements."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character (!@#$%^&*(),.?":{}|<>)')
-        return v
+    newPassword: StrongPassword
@@ -0,0 +1,64 @@
+"""Password hashing with argon2id (upgrading legacy hashes) and reset token digests."""
+
+import asyncio
+import hashlib
+import os
+from typing import Any, Callable, Tuple, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi_core import verify_password as verify_legacy_password
+from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+# argon2id spreads each hash over two lanes, unlike bcrypt's single scalar thread
+_pwd_context = CryptContext(
+    schemes=["argon2"],
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,  # KiB
+    argon2__parallelism=2,
+)
+
+# Cap concurrent hashes so a login burst cannot starve request handling of CPU
+MAX_CONCURRENT_HASHES = max(1, (os.cpu_count() or 2) // 2)
+_hashing_slots = asyncio.Semaphore(MAX_CONCURRENT_HASHES)
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with argon2id."""
+    return _pwd_context.hash(password)
+
+
+def check_password(password: str, hashed_password: str) -> Tuple[bool, bool]:
+    """
+    Verify a password against a stored hash.
+
+    Hashes not produced by this module (bcrypt hashes from fastapi-core) are
+    verified through fastapi-core and always reported as needing a rehash.
+
+    Returns:
+        Tuple of (password is valid, hash should be replaced with hash_password)
+    """
+    if _pwd_context.identify(hashed_password, required=False) is None:
+        is_valid = verify_legacy_password(password, hashed_password)
+        return is_valid, is_valid
+
+    is_valid = _pwd_context.verify(password, hashed_password)
+    return is_valid, is_valid and _pwd_context.needs_update(hashed_password)
+
+
+def hash_reset_token(token: str) -> str:
+    """Return the hex SHA-256 digest used to look up a password reset token."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a CPU-bound hashing call in the threadpool.
+
+    At most MAX_CONCURRENT_HASHES calls run at once; the rest wait on the
+    event loop without holding a worker thread.
+    """
+    async with _hashing_slots:
+        return await run_in_threadpool(func, *args)
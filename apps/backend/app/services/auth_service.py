@@ -2,18 +2,21 @@
 
 import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple, Union
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_core import (
     create_access_token,
     create_refresh_token,
     create_password_reset_token,
-    verify_token,
     token_blacklist,
 )
 
 from app.settings import settings
+from app.cache import invalidate_token, invalidate_user, verify_token_cached
 from app.exceptions import (
     InvalidCredentialsError,
     InvalidTokenError,
@@ -23,8 +26,51 @@ from app.exceptions import (
     InvalidResetTokenError,
     UserAlreadyExistsError,
 )
-from app.models.user import User
+from app.models.user import User, is_valid_user_id
 from app.schemas.auth import LoginResponse, TokenResponse, UserResponse
+from app.security import check_password, hash_password, hash_reset_token, run_password_hashing
+
+# Access token lifetime reported to clients as expiresIn, in seconds
+_ACCESS_TTL_S: int = settings.security.access_token_expires_minutes * 60
+
+
+def create_token_pair(data: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Create an access and a refresh token for the same claims.
+
+    Both tokens are signed by fastapi-core with the application settings, so
+    their format and lifetimes always match what verify_token expects.
+
+    Returns:
+        Tuple of (access token, refresh token)
+    """
+    return create_access_token(data, settings), create_refresh_token(data, settings)
+
+
+def _normalize_email(email: str) -> str:
+    """
+    Lowercase and trim an email for case-insensitive storage and lookup.
+
+    Addresses that are already canonical, as most clients send them, are
+    returned as-is without allocating new strings.
+    """
+    if email and not email[0].isspace() and not email[-1].isspace() and email.islower():
+        return email
+    return email.lower().strip()
+
+
+# Unique index on users.email, as named by the initial migration and by create_all
+_EMAIL_UNIQUE_INDEX = "ix_users_email"
+
+
+def _is_duplicate_email(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError comes from the unique index on users.email."""
+    # asyncpg errors are wrapped by SQLAlchemy's adapter and carry the violated constraint
+    constraint_name = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint_name is not None:
+        return bool(constraint_name == _EMAIL_UNIQUE_INDEX)
+    message = str(error.orig)
+    return _EMAIL_UNIQUE_INDEX in message or "UNIQUE constraint failed: users.email" in message
 
 
 class AuthService:
@@ -36,7 +82,59 @@ class AuthService:
     """
 
     @staticmethod
-    def _create_login_response(user: User) -> LoginResponse:
+    async def _login_row(email: str, db: AsyncSession) -> Optional[Row[Any]]:
+        """
+        Fetch only the columns needed to check credentials and build a login response.
+
+        Returns a plain row instead of an ORM instance, skipping identity-map
+        and attribute instrumentation work on the login path.
+
+        Args:
+            email: Normalized user email address
+            db: Database session
+
+        Returns:
+            Row with id, email, name, hashed_password, is_active, created_at and tier,
+            or None if no user has this email
+        """
+        result = await db.execute(
+            select(
+                User.id,
+                User.email,
+                User.name,
+                User.hashed_password,
+                User.is_active,
+                User.created_at,
+                User.tier,
+            ).where(User.email == email)
+        )
+        return result.first()
+
+    @staticmethod
+    def _user_response(user: Union[User, Row[Any]]) -> UserResponse:
+        """
+        Build UserResponse from a loaded user without re-validating its fields.
+
+        ORM attributes already have the response types, so model_construct skips
+        pydantic's per-field validation while producing the same model.
+
+        Args:
+            user: User (or login row) with id, email, name, is_active, created_at and tier
+
+        Returns:
+            UserResponse with user data
+        """
+        return UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            isActive=user.is_active,
+            createdAt=user.created_at,
+            tier=user.tier,
+        )
+
+    @staticmethod
+    def _create_login_response(user: Union[User, Row[Any]]) -> LoginResponse:
         """
         Create login response with tokens for authenticated user.
 
@@ -46,18 +144,17 @@ class AuthService:
         Returns:
             LoginResponse with user data and tokens
         """
-        access_token = create_access_token({"sub": user.id}, settings)
-        refresh_token = create_refresh_token({"sub": user.id}, settings)
+        access_token, refresh_token = create_token_pair({"sub": user.id})
 
         return LoginResponse(
-            user=UserResponse.model_validate(user),
+            user=AuthService._user_response(user),
             accessToken=access_token,
             refreshToken=refresh_token,
-            expiresIn=settings.security.access_token_expires_minutes * 60,
+            expiresIn=_ACCESS_TTL_S,
         )
 
     @staticmethod
-    async def register_user(email: str, password: str, name: str, db: Session) -> LoginResponse:
+    async def register_user(email: str, password: str, name: str, db: AsyncSession) -> LoginResponse:
         """
         Register new user and return authentication tokens.
 
@@ -74,28 +171,29 @@ class AuthService:
             UserAlreadyExistsError: If email is already registered
         """
         # Normalize email to lowercase for case-insensitive storage
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
 
-        # Check if user already exists
-        existing_user = db.query(User).filter(User.email == normalized_email).first()
-        if existing_user:
-            raise UserAlreadyExistsError()
-
-        # Create new user
+        # Create new user; the unique index on email rejects duplicates in the same round-trip
         user = User(
             email=normalized_email,
             name=name,
         )
-        user.set_password(password)
+        await run_password_hashing(user.set_password, password)
 
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        try:
+            await db.commit()
+        except IntegrityError as error:
+            await db.rollback()
+            if _is_duplicate_email(error):
+                raise UserAlreadyExistsError() from error
+            raise
+        await db.refresh(user)
 
         return AuthService._create_login_response(user)
 
     @staticmethod
-    async def authenticate_user(email: str, password: str, db: Session) -> LoginResponse:
+    async def authenticate_user(email: str, password: str, db: AsyncSession) -> LoginResponse:
         """
         Authenticate user with email and password.
 
@@ -112,21 +210,31 @@ class AuthService:
             InactiveUserError: If user account is inactive
         """
         # Normalize email for case-insensitive lookup
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
 
-        # Get user by email
-        user = db.query(User).filter(User.email == normalized_email).first()
-        if not user or not user.verify_password(password):
+        # Get the credential columns for this email
+        user = await AuthService._login_row(normalized_email, db)
+        if not user:
+            raise InvalidCredentialsError()
+
+        is_valid, needs_rehash = await run_password_hashing(check_password, password, user.hashed_password)
+        if not is_valid:
             raise InvalidCredentialsError()
 
         # Check if user is active
         if not user.is_active:
             raise InactiveUserError()
 
+        # Upgrade legacy bcrypt (or outdated argon2) hashes while the plaintext is at hand
+        if needs_rehash:
+            new_hash = await run_password_hashing(hash_password, password)
+            await db.execute(update(User).where(User.id == user.id).values(hashed_password=new_hash))
+            await db.commit()
+
         return AuthService._create_login_response(user)
 
     @staticmethod
-    async def refresh_tokens(refresh_token: str, db: Session) -> TokenResponse:
+    async def refresh_tokens(refresh_token: str, db: AsyncSession) -> TokenResponse:
         """
         Refresh access token using refresh token.
 
@@ -143,8 +251,8 @@ class AuthService:
             UserNotFoundError: If user doesn't exist
             InactiveUserError: If user account is inactive
         """
-        # Verify refresh token
-        payload = verify_token(refresh_token, settings)
+        # Verify refresh token; retries and parallel tabs reuse the recently verified payload
+        payload = verify_token_cached(refresh_token)
 
         # Check if it's actually a refresh token
         if payload.get("type") != "refresh":
@@ -155,12 +263,12 @@ class AuthService:
         if not user_id:
             raise InvalidTokenError("Invalid token payload")
 
-        # Basic validation that it looks like a ULID (26 characters)
-        if not isinstance(user_id, str) or len(user_id) != 26:
+        # Reject anything that is not a canonical ULID without querying the database
+        if not is_valid_user_id(user_id):
             raise InvalidTokenError("Invalid user ID format in token")
 
         # Verify user exists and is active
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if not user:
             raise UserNotFoundError()
 
@@ -168,13 +276,12 @@ class AuthService:
             raise InactiveUserError()
 
         # Create new tokens
-        new_access_token = create_access_token({"sub": user.id})
-        new_refresh_token = create_refresh_token({"sub": user.id})
+        new_access_token, new_refresh_token = create_token_pair({"sub": user.id})
 
         return TokenResponse(
             accessToken=new_access_token,
             refreshToken=new_refresh_token,
-            expiresIn=settings.security.access_token_expires_minutes * 60,
+            expiresIn=_ACCESS_TTL_S,
         )
 
     @staticmethod
@@ -187,6 +294,8 @@ class AuthService:
             user: Current authenticated user
         """
         token_blacklist.add(access_token)
+        invalidate_token(access_token)
+        invalidate_user(str(user.id))
 
     @staticmethod
     async def get_user_profile(user: User) -> UserResponse:
@@ -199,10 +308,10 @@ class AuthService:
         Returns:
             UserResponse with user data
         """
-        return UserResponse.model_validate(user)
+        return AuthService._user_response(user)
 
     @staticmethod
-    async def request_password_reset(email: str, db: Session) -> Optional[str]:
+    async def request_password_reset(email: str, db: AsyncSession) -> Optional[str]:
         """
         Generate password reset token for user.
 
@@ -214,10 +323,10 @@ class AuthService:
             Reset token if user exists and is active, None otherwise
         """
         # Normalize email
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
 
         # Get user
-        user = db.query(User).filter(User.email == normalized_email).first()
+        user = await db.scalar(select(User).where(User.email == normalized_email))
         if not user or not user.is_active:
             return None
 
@@ -226,12 +335,12 @@ class AuthService:
 
         # Store token in database
         user.set_reset_token(token, datetime.now(timezone.utc) + timedelta(hours=1))
-        db.commit()
+        await db.commit()
 
         return token
 
     @staticmethod
-    async def reset_password(token: str, new_password: str, db: Session) -> bool:
+    async def reset_password(token: str, new_password: str, db: AsyncSession) -> bool:
         """
         Reset user password using reset token.
 
@@ -246,20 +355,18 @@ class AuthService:
         Raises:
             InvalidResetTokenError: If token is invalid or expired
         """
-        # Find user with valid reset token
-        users = db.query(User).filter(User.reset_token.isnot(None)).all()
-
-        for user in users:
-            if user.is_reset_token_valid(token):
-                user.set_password(new_password)
-                user.clear_reset_token()
-                db.commit()
-                return True
-
-        raise InvalidResetTokenError()
+        # Find the user holding this reset token through its indexed digest
+        user = await db.scalar(select(User).where(User.reset_token_hash == hash_reset_token(token)))
+        if not user or not user.is_reset_token_valid(token):
+            raise InvalidResetTokenError()
+
+        await run_password_hashing(user.set_password, new_password)
+        user.clear_reset_token()
+        await db.commit()
+        return True
 
     @staticmethod
-    async def change_password(user_id: str, current_password: str, new_password: str, db: Session) -> bool:
+    async def change_password(user_id: str, current_password: str, new_password: str, db: AsyncSession) -> bool:
         """
         Change user password after verifying current password.
 
@@ -277,7 +384,7 @@ class AuthService:
             UserNotFoundError: If user doesn't exist
             InactiveUserError: If user is inactive
         """
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.scalar(select(User).where(User.id == user_id))
         if not user:
             raise UserNotFoundError()
 
@@ -285,17 +392,18 @@ class AuthService:
             raise InactiveUserError()
 
         # Verify current password
-        if not user.verify_password(current_password):
+        if not await run_password_hashing(user.verify_password, current_password):
             raise InvalidCredentialsError("Current password is incorrect")
 
         # Update password
-        user.set_password(new_password)
-        db.commit()
+        await run_password_hashing(user.set_password, new_password)
+        await db.commit()
+        invalidate_user(user_id)
 
         return True
 
     @staticmethod
-    async def authenticate_with_google(email: str, name: str, google_id: str, db: Session) -> LoginResponse:
+    async def authenticate_with_google(email: str, name: str, google_id: str, db: AsyncSession) -> LoginResponse:
         """
         Authenticate user with Google OAuth.
 
@@ -314,10 +422,10 @@ class AuthService:
             InactiveUserError: If user account is inactive
         """
         # Normalize email
-        normalized_email = email.lower().strip()
+        normalized_email = _normalize_email(email)
 
         # Check if user exists
-        user = db.query(User).filter(User.email == normalized_email).first()
+        user = await db.scalar(select(User).where(User.email == normalized_email))
 
         if not user:
             # Create new user with Google OAuth
@@ -328,11 +436,22 @@ class AuthService:
                 email=normalized_email,
                 name=name,
             )
-            user.set_password(random_password)
+            # Hashing is CPU-bound; keep it off the event loop
+            await run_password_hashing(user.set_password, random_password)
 
             db.add(user)
-            db.commit()
-            db.refresh(user)
+            try:
+                await db.commit()
+            except IntegrityError as error:
+                await db.rollback()
+                if not _is_duplicate_email(error):
+                    raise
+                # A concurrent callback created the same account first; use that one
+                user = await db.scalar(select(User).where(User.email == normalized_email))
+                if not user:
+                    raise
+            else:
+                await db.refresh(user)
 
         # Check if user is active
         if not user.is_active:
@@ -20,6 +20,33 @@ class Settings(BaseSettings):
         description="Frontend application URL for reset links and redirects"
     )
 
+    # Connection pool tuning for the async SQLAlchemy engine
+    database_pool_size: int = Field(
+        default=10,
+        validation_alias="DATABASE_POOL_SIZE",
+        description="Number of connections kept open in the pool"
+    )
+    database_max_overflow: int = Field(
+        default=20,
+        validation_alias="DATABASE_MAX_OVERFLOW",
+        description="Max number of connections to create beyond the pool size"
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        validation_alias="DATABASE_POOL_RECYCLE",
+        description="Seconds after which a pooled connection is replaced"
+    )
+    database_statement_timeout_ms: int = Field(
+        default=5000,
+        validation_alias="DATABASE_STATEMENT_TIMEOUT_MS",
+        description="Server-side statement timeout for application connections"
+    )
+    database_use_pgbouncer: bool = Field(
+        default=False,
+        validation_alias="DATABASE_USE_PGBOUNCER",
+        description="Disable local pooling when connecting through PgBouncer in transaction mode"
+    )
+
 
 # Global settings instance
 settings = Settings()
@@ -0,0 +1,47 @@
+"""Shared fixtures for backend tests."""
+
+import asyncio
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-that-is-at-least-32-characters-long")
+
+import pytest
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+from app.models import User  # noqa: F401 - registers the users table
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    """Store JSONB columns as JSON so the users table can be created on SQLite."""
+    return "JSON"
+
+
+class Profile(Base):
+    """Minimal stand-in for the profiles model that User.profile refers to."""
+
+    __tablename__ = "profiles"
+
+    id = Column(String(26), primary_key=True)
+    user_id = Column(String(26), ForeignKey("users.id"))
+    user = relationship("User", back_populates="profile")
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Session factory bound to a fresh SQLite database with all tables created."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
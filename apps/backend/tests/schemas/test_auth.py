@@ -0,0 +1,19 @@
+"""Tests for authentication schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.auth import ForgotPasswordRequest
+
+
+def test_email_is_normalized_like_email_str():
+    assert ForgotPasswordRequest(email="Jane@Example.COM").email == "Jane@example.com"
+
+
+@pytest.mark.parametrize(
+    "email",
+    ["a" * 250 + "@x.com", "a@@example.com", "no-at-sign", "<jane@example.com>", "\x00jane@example.com"],
+)
+def test_email_prefilter_rejects_malformed_addresses(email):
+    with pytest.raises(ValidationError, match="value is not a valid email address"):
+        ForgotPasswordRequest(email=email)
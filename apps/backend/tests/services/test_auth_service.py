@@ -0,0 +1,98 @@
+"""Tests for AuthService."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.exceptions import UserAlreadyExistsError
+from app.models import User
+from app.schemas.auth import UserResponse
+from app.services.auth_service import AuthService, _is_duplicate_email
+
+
+def _user() -> User:
+    return User(
+        id="01HZY3QJ8K2V6N7P9R4S5T6W7X",
+        email="jane@example.com",
+        name="Jane Doe",
+        hashed_password="x",
+        is_active=True,
+        tier="pro",
+        created_at=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+    )
+
+
+def test_user_response_matches_model_validate_for_orm_user():
+    user = _user()
+
+    expected = UserResponse.model_validate(user).model_dump_json()
+
+    assert AuthService._user_response(user).model_dump_json() == expected
+
+
+def test_user_response_matches_model_validate_for_login_row(session_factory):
+    async def scenario():
+        async with session_factory() as db:
+            db.add(_user())
+            await db.commit()
+            return await AuthService._login_row("jane@example.com", db)
+
+    row = asyncio.run(scenario())
+
+    expected = UserResponse.model_validate(row).model_dump_json()
+
+    assert AuthService._user_response(row).model_dump_json() == expected
+
+
+def test_reset_password_with_expiry_read_back_from_sqlite(session_factory):
+    async def scenario():
+        async with session_factory() as db:
+            db.add(_user())
+            await db.commit()
+            token = await AuthService.request_password_reset("jane@example.com", db)
+
+        # A fresh session reads reset_token_expiry back as a naive datetime
+        async with session_factory() as db:
+            return await AuthService.reset_password(token, "N3w-Passw0rd!", db)
+
+    assert asyncio.run(scenario()) is True
+
+
+def _integrity_error(message: str, constraint_name=None) -> IntegrityError:
+    orig = Exception(message)
+    if constraint_name is not None:
+        cause = Exception(message)
+        cause.constraint_name = constraint_name  # type: ignore[attr-defined]
+        orig.__cause__ = cause
+    return IntegrityError("INSERT INTO users ...", {}, orig)
+
+
+def test_is_duplicate_email_matches_the_email_unique_index():
+    assert _is_duplicate_email(
+        _integrity_error('duplicate key value violates unique constraint "ix_users_email"', "ix_users_email")
+    )
+    assert _is_duplicate_email(_integrity_error("UNIQUE constraint failed: users.email"))
+
+
+def test_is_duplicate_email_ignores_other_violations_mentioning_the_email():
+    message = (
+        'null value in column "name" of relation "users" violates not-null constraint\n'
+        "DETAIL:  Failing row contains (01HZY3QJ8K2V6N7P9R4S5T6W7X, jane@example.com, null)."
+    )
+
+    assert not _is_duplicate_email(_integrity_error(message, None))
+    assert not _is_duplicate_email(_integrity_error(message, "users_name_not_null"))
+    assert not _is_duplicate_email(_integrity_error("NOT NULL constraint failed: users.email"))
+
+
+def test_register_user_rejects_duplicate_email(session_factory):
+    async def scenario():
+        async with session_factory() as db:
+            await AuthService.register_user("jane@example.com", "Passw0rd!", "Jane Doe", db)
+        async with session_factory() as db:
+            await AuthService.register_user("Jane@Example.com", "Passw0rd!", "Jane Doe", db)
+
+    with pytest.raises(UserAlreadyExistsError):
+        asyncio.run(scenario())
@@ -0,0 +1,25 @@
+"""Tests for the in-process authentication caches."""
+
+import time
+
+from app.cache import TOKEN_CACHE_TTL, _token_ttu
+
+
+def test_token_ttu_is_capped_at_cache_ttl():
+    now = 1000.0
+    payload = {"exp": time.time() + 3600}
+
+    assert _token_ttu(b"key", payload, now) == now + TOKEN_CACHE_TTL
+
+
+def test_token_ttu_does_not_outlive_token_expiry():
+    now = 1000.0
+    payload = {"exp": time.time() + 5}
+
+    assert _token_ttu(b"key", payload, now) <= now + 5
+
+
+def test_token_ttu_expires_payload_without_exp_immediately():
+    now = 1000.0
+
+    assert _token_ttu(b"key", {}, now) <= now